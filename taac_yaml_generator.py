@@ -1,7 +1,57 @@
+import os
+import re
+import sys
+import csv
+import json
 import yaml
+import argparse
 from datetime import datetime
 from termcolor import colored
 
+YamlDumper = getattr(yaml, 'CSafeDumper', yaml.SafeDumper)
+
+CRITICALITY_LEVELS = ['Tier1', 'Tier2', 'Tier3']
+DATA_TYPES = ['Secret', 'Confidential', 'Internal', 'Public']
+SAFE_FILE_NAME = re.compile(r'^[A-Za-z0-9][A-Za-z0-9 ._-]*$')
+
+def is_yes_no(value):
+    return value.lower() in ['yes', 'no']
+
+def is_criticality(value):
+    return value in CRITICALITY_LEVELS
+
+def is_data_type(value):
+    return value in DATA_TYPES
+
+def is_network_access(value):
+    return value.lower() in ['public', 'private']
+
+YAML_SECTIONS = [
+    ('Version', None),
+    ('Date', None),
+    ('Description', 'Service Description'),
+    ('Functionality', 'Service Functionality'),
+    ('DataProcessed', 'Data Processing Details'),
+    ('Components', 'Components Used by the Service'),
+    ('Pipeline', 'Pipeline Configuration'),
+    ('Network', 'Network Information'),
+    ('dataFlow', 'Data Flow')
+]
+
+def render_yaml(service_description):
+    # All sections are dumped in a single pass; the document markers are then used
+    # to interleave the section comments.
+    dumped = yaml.dump_all([{key: service_description[key]} for key, _ in YAML_SECTIONS],
+                           Dumper=YamlDumper, default_flow_style=False, explicit_start=True)
+    blocks = re.split(r'^---\n', dumped, flags=re.MULTILINE)[1:]
+
+    parts = []
+    for (_, comment), block in zip(YAML_SECTIONS, blocks):
+        if comment:
+            parts.append(f"\n# {comment}\n")
+        parts.append(block)
+    return ''.join(parts)
+
 class ServiceDescriptionGenerator:
     def __init__(self):
         self.service_description = {}
@@ -26,7 +76,7 @@ class ServiceDescriptionGenerator:
             'Name': self.get_user_input("Enter the service name (e.g., AuthService): "),
             'Type': self.get_user_input("Enter the service type (e.g., Authentication): "),
             'Criticality': self.get_user_input("Enter the service criticality (Tier1/Tier2/Tier3): ",
-                                               validation=lambda x: x in ['Tier1', 'Tier2', 'Tier3'])
+                                               validation=is_criticality)
         }
 
         print(colored("\n# Service Functionality", 'green', attrs=['bold']))
@@ -35,21 +85,21 @@ class ServiceDescriptionGenerator:
         print(colored("\n# Data Processing Details", 'green', attrs=['bold']))
         self.service_description['DataProcessed'] = {
             'Type': self.get_user_input("Enter the type of data processed (Secret/Confidential/Internal/Public): ",
-                                        validation=lambda x: x in ['Secret', 'Confidential', 'Internal', 'Public']),
+                                        validation=is_data_type),
             'DataCategory': self.get_user_input("Enter the data category (Auth/PCI/PII/etc): "),
             'EncryptionAtRest': self.get_user_input("Is data encrypted at rest? (Yes/No): ",
-                                                    validation=lambda x: x.lower() in ['yes', 'no']).capitalize()
+                                                    validation=is_yes_no).capitalize()
         }
 
         print(colored("\n# Components Used by the Service", 'green', attrs=['bold']))
         self.service_description['Components'] = {
             'Internal': {
                 'Exist': self.get_user_input("Do internal components exist? (Yes/No): ",
-                                             validation=lambda x: x.lower() in ['yes', 'no']).capitalize()
+                                             validation=is_yes_no).capitalize()
             },
             'External': {
                 'Exist': self.get_user_input("Do external components exist? (Yes/No): ",
-                                             validation=lambda x: x.lower() in ['yes', 'no']).capitalize()
+                                             validation=is_yes_no).capitalize()
             }
         }
         if self.service_description['Components']['Internal']['Exist'] == 'Yes':
@@ -62,19 +112,19 @@ class ServiceDescriptionGenerator:
         self.service_description['Pipeline'] = {
             'Type': self.get_user_input("Enter the CI/CD pipeline type (GithubActions/Jenkins/etc): "),
             'CODEOWNERS': self.get_user_input("Are CODEOWNERS used? (Yes/No): ",
-                                              validation=lambda x: x.lower() in ['yes', 'no']).capitalize(),
+                                              validation=is_yes_no).capitalize(),
             'BranchProtection': self.get_user_input("Is branch protection enabled? (Yes/No): ",
-                                                    validation=lambda x: x.lower() in ['yes', 'no']).capitalize(),
+                                                    validation=is_yes_no).capitalize(),
             'SignCommits': self.get_user_input("Are commits signed? (Yes/No): ",
-                                               validation=lambda x: x.lower() in ['yes', 'no']).capitalize(),
+                                               validation=is_yes_no).capitalize(),
             'PinActions': self.get_user_input("Are actions pinned? (Yes/No): ",
-                                              validation=lambda x: x.lower() in ['yes', 'no']).capitalize()
+                                              validation=is_yes_no).capitalize()
         }
 
         print(colored("\n# Network Information", 'green', attrs=['bold']))
         self.service_description['Network'] = {
             'Access': self.get_user_input("Enter the network access level (Public/Private): ",
-                                          validation=lambda x: x.lower() in ['public', 'private']).capitalize()
+                                          validation=is_network_access).capitalize()
         }
 
         print(colored("\n# Data Flow", 'green', attrs=['bold']))
@@ -106,7 +156,7 @@ class ServiceDescriptionGenerator:
 
         while True:
             add_flow = self.get_user_input("\nDo you want to add a data flow? (Yes/No): ",
-                                           validation=lambda x: x.lower() in ['yes', 'no'])
+                                           validation=is_yes_no)
             if add_flow.lower() != 'yes':
                 break
 
@@ -115,10 +165,10 @@ class ServiceDescriptionGenerator:
                 'description': self.get_user_input("Enter a brief description of the data flow: "),
                 'source': self.get_user_input("Enter the source of the data flow: "),
                 'EncryptionTransit': self.get_user_input("Is data encrypted in transit? (Yes/No): ",
-                                                         validation=lambda x: x.lower() in ['yes', 'no']).capitalize(),
+                                                         validation=is_yes_no).capitalize(),
                 'Authentication': {
                     'Exist': self.get_user_input("Does authentication exist for this data flow? (Yes/No): ",
-                                                 validation=lambda x: x.lower() in ['yes', 'no']).capitalize()
+                                                 validation=is_yes_no).capitalize()
                 },
                 'Authorization': self.get_user_input("Enter the authorization level (read/write/admin/etc): "),
                 'Protocol': self.get_user_input("Enter the communication protocol (HTTPS/AMQP/etc): "),
@@ -134,7 +184,7 @@ class ServiceDescriptionGenerator:
 
             while True:
                 add_interaction = self.get_user_input("Do you want to add an interaction? (Yes/No): ",
-                                                      validation=lambda x: x.lower() in ['yes', 'no'])
+                                                      validation=is_yes_no)
                 if add_interaction.lower() != 'yes':
                     break
 
@@ -154,26 +204,276 @@ class ServiceDescriptionGenerator:
 
     def save_yaml_file(self, file_name):
         with open(file_name, 'w') as file:
-            file.write(f"Version: '{self.service_description['Version']}'\n")
-            file.write(f"Date: {self.service_description['Date']}\n\n")
-            file.write("# Service Description\n")
-            file.write(yaml.dump({'Description': self.service_description['Description']}, default_flow_style=False))
-            file.write("\n# Service Functionality\n")
-            file.write(f"Functionality: {self.service_description['Functionality']}\n\n")
-            file.write("# Data Processing Details\n")
-            file.write(yaml.dump({'DataProcessed': self.service_description['DataProcessed']}, default_flow_style=False))
-            file.write("\n# Components Used by the Service\n")
-            file.write(yaml.dump({'Components': self.service_description['Components']}, default_flow_style=False))
-            file.write("\n# Pipeline Configuration\n")
-            file.write(yaml.dump({'Pipeline': self.service_description['Pipeline']}, default_flow_style=False))
-            file.write("\n# Network Information\n")
-            file.write(yaml.dump({'Network': self.service_description['Network']}, default_flow_style=False))
-            file.write("\n# Data Flow\n")
-            file.write(yaml.dump({'dataFlow': self.service_description['dataFlow']}, default_flow_style=False))
+            file.write(render_yaml(self.service_description))
 
         print(colored(f"\nService description saved to {file_name}", 'green'))
 
+class BulkServiceDescriptionGenerator:
+    """Generates service descriptions from a CSV, JSON or JSON Lines inventory.
+
+    Each inventory record describes one service using the columns below. The
+    'dataFlow' column holds a list of data flow records shaped like the YAML
+    'dataFlow' entries (JSON encoded when the inventory is a CSV file).
+    """
+
+    def __init__(self, output_dir='.'):
+        self.output_dir = output_dir
+        self.date = datetime.now().strftime("%d.%m.%Y")
+        self.errors = []
+        self.generated = []
+        self.inventory_error = None
+
+    @staticmethod
+    def read_inventory(file_path):
+        """Yields (record, error) pairs; a record that cannot be parsed is yielded as (None, error)."""
+        extension = os.path.splitext(file_path)[1].lower()
+        with open(file_path, 'r', newline='', encoding='utf-8-sig') as file:
+            if extension == '.csv':
+                for record in csv.DictReader(file):
+                    yield record, None
+            elif extension == '.jsonl':
+                for line in file:
+                    if not line.strip():
+                        continue
+                    try:
+                        yield json.loads(line), None
+                    except json.JSONDecodeError as e:
+                        yield None, f"Invalid JSON ({e})."
+            elif extension == '.json':
+                records = json.load(file)
+                if not isinstance(records, list):
+                    raise ValueError("JSON inventory must contain a list of services.")
+                for record in records:
+                    yield record, None
+            else:
+                raise ValueError(f"Unsupported inventory format '{extension}'. Use .csv, .json or .jsonl.")
+
+    @staticmethod
+    def get_field(record, key, errors, required=True, validation=None, field=None):
+        field = field or key
+        value = record.get(key)
+        if isinstance(value, bool) and validation is is_yes_no:
+            value = 'Yes' if value else 'No'
+        elif isinstance(value, bool) or not isinstance(value, (str, int, float, type(None))):
+            errors.append(f"{field}: expected a text value, got {type(value).__name__}.")
+            return ''
+        value = '' if value is None else str(value).strip()
+        if not value and required:
+            errors.append(f"{field}: this field is required.")
+        elif value and validation and not validation(value):
+            errors.append(f"{field}: invalid value '{value}'.")
+        return value
+
+    def build_data_flow(self, flow, index, errors):
+        prefix = f"dataFlow[{index}]"
+        if not isinstance(flow, dict):
+            errors.append(f"{prefix}: data flow must be a record.")
+            return None
+
+        authentication = flow.get('Authentication') or {}
+        communication = flow.get('Communication') or {}
+        if not isinstance(authentication, dict) or not isinstance(communication, dict):
+            errors.append(f"{prefix}: 'Authentication' and 'Communication' must be records.")
+            return None
+
+        data_flow = {
+            'name': self.get_field(flow, 'name', errors, field=f"{prefix}.name"),
+            'description': self.get_field(flow, 'description', errors, field=f"{prefix}.description"),
+            'source': self.get_field(flow, 'source', errors, field=f"{prefix}.source"),
+            'EncryptionTransit': self.get_field(flow, 'EncryptionTransit', errors, validation=is_yes_no,
+                                                field=f"{prefix}.EncryptionTransit").capitalize(),
+            'Authentication': {
+                'Exist': self.get_field(authentication, 'Exist', errors, validation=is_yes_no,
+                                        field=f"{prefix}.Authentication.Exist").capitalize()
+            },
+            'Authorization': self.get_field(flow, 'Authorization', errors, field=f"{prefix}.Authorization"),
+            'Protocol': self.get_field(flow, 'Protocol', errors, field=f"{prefix}.Protocol"),
+            'Communication': {
+                'Type': self.get_field(communication, 'Type', errors, field=f"{prefix}.Communication.Type")
+            },
+            'interactions': [],
+            'servicesInvolved': []
+        }
+
+        if data_flow['Authentication']['Exist'] == 'Yes':
+            data_flow['Authentication']['Type'] = self.get_field(authentication, 'Type', errors,
+                                                                 field=f"{prefix}.Authentication.Type")
+
+        interactions = flow.get('interactions') or []
+        if not isinstance(interactions, list):
+            errors.append(f"{prefix}.interactions: must be a list.")
+            interactions = []
+        for position, record in enumerate(interactions):
+            field = f"{prefix}.interactions[{position}]"
+            if not isinstance(record, dict):
+                errors.append(f"{field}: interaction must be a record.")
+                continue
+            interaction = {
+                key: self.get_field(record, key, errors, field=f"{field}.{key}")
+                for key in ['from', 'to', 'method', 'protocol']
+            }
+            data_flow['interactions'].append(interaction)
+            data_flow['servicesInvolved'].extend([interaction['from'], interaction['to']])
+
+        data_flow['servicesInvolved'] = list(dict.fromkeys(data_flow['servicesInvolved']))
+        return data_flow
+
+    def build_service_description(self, record):
+        errors = []
+
+        def get(key, **kwargs):
+            return self.get_field(record, key, errors, **kwargs)
+
+        service_description = {
+            'Version': get('Version'),
+            'Date': self.date,
+            'Description': {
+                'Name': get('Name'),
+                'Type': get('Type'),
+                'Criticality': get('Criticality', validation=is_criticality)
+            },
+            'Functionality': get('Functionality'),
+            'DataProcessed': {
+                'Type': get('DataType', validation=is_data_type),
+                'DataCategory': get('DataCategory'),
+                'EncryptionAtRest': get('EncryptionAtRest', validation=is_yes_no).capitalize()
+            },
+            'Components': {
+                'Internal': {
+                    'Exist': get('InternalComponents', validation=is_yes_no).capitalize()
+                },
+                'External': {
+                    'Exist': get('ExternalComponents', validation=is_yes_no).capitalize()
+                }
+            },
+            'Pipeline': {
+                'Type': get('PipelineType'),
+                'CODEOWNERS': get('CODEOWNERS', validation=is_yes_no).capitalize(),
+                'BranchProtection': get('BranchProtection', validation=is_yes_no).capitalize(),
+                'SignCommits': get('SignCommits', validation=is_yes_no).capitalize(),
+                'PinActions': get('PinActions', validation=is_yes_no).capitalize()
+            },
+            'Network': {
+                'Access': get('NetworkAccess', validation=is_network_access).capitalize()
+            },
+            'dataFlow': []
+        }
+
+        components = service_description['Components']
+        if components['Internal']['Exist'] == 'Yes':
+            components['Internal']['Source'] = get('InternalSource')
+            components['Internal']['Note'] = get('InternalNote', required=False)
+        if components['External']['Exist'] == 'Yes':
+            components['External']['PackageManager'] = get('PackageManager')
+
+        data_flows = record.get('dataFlow') or []
+        if isinstance(data_flows, str):
+            try:
+                data_flows = json.loads(data_flows)
+            except json.JSONDecodeError as e:
+                errors.append(f"dataFlow: invalid JSON ({e}).")
+                data_flows = []
+        if not isinstance(data_flows, list):
+            errors.append("dataFlow: must be a list of data flow records.")
+            data_flows = []
+        for index, flow in enumerate(data_flows):
+            data_flow = self.build_data_flow(flow, index, errors)
+            if data_flow:
+                service_description['dataFlow'].append(data_flow)
+
+        return service_description, errors
+
+    def generate(self, inventory_path):
+        try:
+            self.generate_records(inventory_path)
+        except (OSError, ValueError, csv.Error) as e:
+            self.inventory_error = f"Error reading inventory '{inventory_path}': {e}"
+        return self.generated, self.errors
+
+    def generate_records(self, inventory_path):
+        file_names = set()
+
+        for record_number, (record, error) in enumerate(self.read_inventory(inventory_path), start=1):
+            if error:
+                self.errors.append((record_number, '', [error]))
+                continue
+            if not isinstance(record, dict):
+                self.errors.append((record_number, '', ["Service must be a record."]))
+                continue
+
+            service_description, errors = self.build_service_description(record)
+            name = service_description['Description']['Name']
+            file_name = os.path.join(self.output_dir, f"{name.replace(' ', '_')}.yaml")
+            # Compare case-insensitively so 'A' and 'a' do not overwrite each other
+            # on case-insensitive filesystems.
+            file_key = os.path.normcase(file_name).lower()
+            if name and not SAFE_FILE_NAME.match(name):
+                errors.append(f"Name: '{name}' cannot be used as a file name.")
+            elif name and file_key in file_names:
+                errors.append(f"Name: duplicate service '{name}'.")
+            if errors:
+                self.errors.append((record_number, name, errors))
+                continue
+
+            try:
+                if not self.generated:
+                    os.makedirs(self.output_dir, exist_ok=True)
+                with open(file_name, 'w') as file:
+                    file.write(render_yaml(service_description))
+            except OSError as e:
+                self.errors.append((record_number, name, [f"Unable to write '{file_name}': {e}"]))
+                continue
+            file_names.add(file_key)
+            self.generated.append(file_name)
+
+    def save_error_report(self, file_name):
+        try:
+            with open(file_name, 'w', newline='') as file:
+                writer = csv.writer(file)
+                writer.writerow(['Record', 'Service', 'Error'])
+                for record_number, name, errors in self.errors:
+                    for error in errors:
+                        writer.writerow([record_number, name, error])
+                if self.inventory_error:
+                    writer.writerow(['', '', self.inventory_error])
+        except OSError as e:
+            print(colored(f"Unable to write error report '{file_name}': {e}", 'red'))
+            return False
+
+        print(colored(f"Error report saved to {file_name}", 'yellow'))
+        return True
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='Generate TaaC-AI service descriptions in YAML format.')
+    parser.add_argument('--inventory', help='Path to a CSV, JSON or JSON Lines service inventory for non-interactive bulk generation.')
+    parser.add_argument('--output-dir', default='.', help='Directory to write the generated YAML files to (bulk mode).')
+    parser.add_argument('--error-report', help='Path to a CSV file to write the per-record error report to (bulk mode).')
+    return parser.parse_args()
+
+def run_bulk(args):
+    generator = BulkServiceDescriptionGenerator(args.output_dir)
+    generated, errors = generator.generate(args.inventory)
+
+    for record_number, name, record_errors in errors:
+        print(colored(f"Record {record_number} ({name or 'unnamed'}):", 'red', attrs=['bold']))
+        for error in record_errors:
+            print(colored(f"  - {error}", 'red'))
+    if generator.inventory_error:
+        print(colored(generator.inventory_error, 'red'))
+
+    failed = bool(errors or generator.inventory_error)
+    if args.error_report and not generator.save_error_report(args.error_report):
+        failed = True
+
+    print(colored(f"\nGenerated {len(generated)} service description(s) in {args.output_dir}, "
+                  f"{len(errors)} record(s) skipped.", 'yellow' if failed else 'green'))
+    return 1 if failed else 0
+
 def main():
+    args = parse_arguments()
+    if args.inventory:
+        return run_bulk(args)
+
     print(colored("**Welcome to the Service Description Generator!**", 'cyan', attrs=['bold']))
     print(colored("- This tool is designed to generate a valid service description for AI-driven Threat modeling-as-a-Code (TaaC-AI).", 'cyan'))
     print(colored("- TaaC-AI is available at https://github.com/yevh/TaaC-AI/", 'cyan'))
@@ -188,6 +488,7 @@ def main():
         file_name += '.yaml'
 
     generator.save_yaml_file(file_name)
+    return 0
 
 if __name__ == "__main__":
-    main()
+    sys.exit(main())
@@ -0,0 +1,183 @@
+import os
+import csv
+import sys
+import json
+import yaml
+import argparse
+import importlib.util
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from taac_yaml_generator import BulkServiceDescriptionGenerator, render_yaml, run_bulk
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+DATA_FLOW = {
+    'name': 'UserAuthenticationFlow',
+    'description': 'Authenticates users and issues tokens.',
+    'source': 'UserLoginInterface',
+    'EncryptionTransit': 'Yes',
+    'Authentication': {'Exist': 'Yes', 'Type': 'JWT'},
+    'Authorization': 'read-write',
+    'Protocol': 'HTTPS',
+    'Communication': {'Type': 'RESTful API'},
+    'interactions': [
+        {'from': 'UserLoginInterface', 'to': 'AuthService', 'method': 'RESTful API', 'protocol': 'HTTPS'},
+        {'from': 'AuthService', 'to': 'UserDatabase', 'method': 'Query', 'protocol': 'JDBC'}
+    ]
+}
+
+SERVICE = {
+    'Version': '1.0', 'Name': 'AuthService', 'Type': 'Service', 'Criticality': 'Tier1',
+    'Functionality': 'Handles auth: login and tokens.',
+    'DataType': 'Confidential', 'DataCategory': 'Auth', 'EncryptionAtRest': 'yes',
+    'InternalComponents': 'Yes', 'InternalSource': 'Private', 'InternalNote': 'Scoped Package Access',
+    'ExternalComponents': 'Yes', 'PackageManager': 'NPM',
+    'PipelineType': 'GithubActions', 'CODEOWNERS': 'Yes', 'BranchProtection': 'Yes',
+    'SignCommits': 'Yes', 'PinActions': 'Yes', 'NetworkAccess': 'private',
+    'dataFlow': [DATA_FLOW]
+}
+
+
+def load_taac():
+    spec = importlib.util.spec_from_file_location('taac_ai', os.path.join(ROOT, 'TaaC-AI.py'))
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def service(**overrides):
+    record = dict(SERVICE)
+    record.update(overrides)
+    return record
+
+
+def write_csv(path, records):
+    with open(path, 'w', newline='', encoding='utf-8-sig') as file:
+        writer = csv.DictWriter(file, fieldnames=list(SERVICE))
+        writer.writeheader()
+        for record in records:
+            writer.writerow(dict(record, dataFlow=json.dumps(record['dataFlow'])))
+
+
+def write_jsonl(path, lines):
+    with open(path, 'w') as file:
+        file.write('\n'.join(line if isinstance(line, str) else json.dumps(line) for line in lines))
+
+
+def read_report(path):
+    with open(path, newline='') as file:
+        return list(csv.reader(file))
+
+
+def bulk_args(inventory, output_dir, error_report=None):
+    return argparse.Namespace(inventory=str(inventory), output_dir=str(output_dir),
+                              error_report=str(error_report) if error_report else None)
+
+
+def test_render_yaml_round_trips_and_passes_taac_validation(tmp_path):
+    generator = BulkServiceDescriptionGenerator(str(tmp_path))
+    description, errors = generator.build_service_description(service())
+    assert errors == []
+
+    data = yaml.safe_load(render_yaml(description))
+    assert data == description
+    assert data['Functionality'] == 'Handles auth: login and tokens.'
+    assert data['dataFlow'][0]['servicesInvolved'] == ['UserLoginInterface', 'AuthService', 'UserDatabase']
+
+    valid, message = load_taac().YAMLDataHandler.validate_yaml_data(data)
+    assert valid, message
+
+
+def test_csv_records_are_validated_individually(tmp_path):
+    inventory = tmp_path / 'inventory.csv'
+    write_csv(inventory, [service(), service(Name='Billing', Criticality='Tier4', EncryptionAtRest='maybe')])
+
+    generated, errors = BulkServiceDescriptionGenerator(str(tmp_path / 'out')).generate(str(inventory))
+
+    assert generated == [str(tmp_path / 'out' / 'AuthService.yaml')]
+    assert errors == [(2, 'Billing', ["Criticality: invalid value 'Tier4'.",
+                                      "EncryptionAtRest: invalid value 'maybe'."])]
+
+
+def test_jsonl_bad_line_does_not_stop_the_batch(tmp_path):
+    inventory = tmp_path / 'inventory.jsonl'
+    write_jsonl(inventory, [service(Name='A'), '{bad', service(Name='B')])
+
+    generator = BulkServiceDescriptionGenerator(str(tmp_path / 'out'))
+    generated, errors = generator.generate(str(inventory))
+
+    assert [os.path.basename(name) for name in generated] == ['A.yaml', 'B.yaml']
+    assert len(errors) == 1 and errors[0][0] == 2
+    assert errors[0][2][0].startswith('Invalid JSON')
+    assert generator.inventory_error is None
+
+
+def test_bool_coercion_is_limited_to_yes_no_fields(tmp_path):
+    generator = BulkServiceDescriptionGenerator(str(tmp_path))
+    description, errors = generator.build_service_description(
+        service(EncryptionAtRest=False, Version=True, Name=['A'], Type={'x': 1}))
+
+    assert description['DataProcessed']['EncryptionAtRest'] == 'No'
+    assert errors == ["Version: expected a text value, got bool.",
+                      "Name: expected a text value, got list.",
+                      "Type: expected a text value, got dict."]
+
+
+def test_duplicate_and_unsafe_names_are_rejected(tmp_path):
+    inventory = tmp_path / 'inventory.jsonl'
+    names = ['Svc', 'svc', 'team/Svc', '../escape', str(tmp_path / 'abs')]
+    write_jsonl(inventory, [service(Name=name) for name in names])
+
+    generated, errors = BulkServiceDescriptionGenerator(str(tmp_path / 'out')).generate(str(inventory))
+
+    assert os.listdir(tmp_path / 'out') == ['Svc.yaml']
+    assert len(generated) == 1
+    assert errors == [
+        (2, 'svc', ["Name: duplicate service 'svc'."]),
+        (3, 'team/Svc', ["Name: 'team/Svc' cannot be used as a file name."]),
+        (4, '../escape', ["Name: '../escape' cannot be used as a file name."]),
+        (5, names[4], [f"Name: '{names[4]}' cannot be used as a file name."])
+    ]
+    assert not (tmp_path / 'escape.yaml').exists()
+    assert not (tmp_path / 'abs.yaml').exists()
+
+
+def test_error_report_lists_record_errors(tmp_path):
+    inventory = tmp_path / 'inventory.csv'
+    report = tmp_path / 'errors.csv'
+    write_csv(inventory, [service(), service(Name='AuthService')])
+
+    assert run_bulk(bulk_args(inventory, tmp_path / 'out', report)) == 1
+    assert read_report(report) == [['Record', 'Service', 'Error'],
+                                   ['2', 'AuthService', "Name: duplicate service 'AuthService'."]]
+
+
+def test_error_report_is_rewritten_on_a_clean_run(tmp_path):
+    inventory = tmp_path / 'inventory.csv'
+    report = tmp_path / 'errors.csv'
+    report.write_text('Record,Service,Error\n1,Old,stale error\n')
+    write_csv(inventory, [service()])
+
+    assert run_bulk(bulk_args(inventory, tmp_path / 'out', report)) == 0
+    assert read_report(report) == [['Record', 'Service', 'Error']]
+
+
+def test_inventory_failure_is_reported(tmp_path):
+    report = tmp_path / 'errors.csv'
+    output_dir = tmp_path / 'out'
+
+    assert run_bulk(bulk_args(tmp_path / 'missing.csv', output_dir, report)) == 1
+    rows = read_report(report)
+    assert rows[1][:2] == ['', '']
+    assert rows[1][2].startswith("Error reading inventory")
+    assert not output_dir.exists()
+
+
+def test_unwritable_error_report_fails_the_run(tmp_path):
+    inventory = tmp_path / 'inventory.csv'
+    write_csv(inventory, [service()])
+
+    args = bulk_args(inventory, tmp_path / 'out', tmp_path / 'missing-dir' / 'errors.csv')
+    assert run_bulk(args) == 1
+    assert os.path.exists(tmp_path / 'out' / 'AuthService.yaml')